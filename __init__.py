@@ -1,4 +1,4 @@
 # my_docker_framework/__init__.py
-from .factorymanager import FactoryManager
+from .factorymanager import FactoryManager, b64decode_untrusted
 
-__all__ = ["FactoryManager"]
+__all__ = ["FactoryManager", "b64decode_untrusted"]
@@ -1,7 +1,16 @@
 from factorymanager import FactoryManager
+import os
 import time
 import base64
 
+try:
+    # SIMD-accelerated base64 (SSSE3/AVX2/AVX-512, picked at runtime) — a
+    # drop-in replacement that is ~7-10x faster on the multi-MB screenshot
+    # payloads returned by screen_capture(full=True).
+    import pybase64 as b64
+except ImportError:
+    b64 = base64
+
 container_name = "chromium"
 image = "lscr.io/linuxserver/chromium:latest"
 ports = {"3000/tcp": 3000, "3001/tcp": 3001}
@@ -34,11 +43,20 @@ try:
         # Example command that might cause an error.
         time.sleep(10)
         image = fw.screen_capture(full=True)
-        decoded_image = base64.b64decode(image)
+        # Decode straight into a mutable bytearray when pybase64 is
+        # available — one allocation, no copy into an immutable bytes
+        # result; os.write below takes the buffer without copying either.
+        if hasattr(b64, "b64decode_as_bytearray"):
+            decoded_image = b64.b64decode_as_bytearray(image, validate=False)
+        else:
+            decoded_image = b64.b64decode(image, validate=False)
 
-        # Save the decoded image data to a PNG file
-        with open("screenshot.png", "wb") as f:
-            f.write(decoded_image)
+        # Save the decoded image data to a PNG file. Raw os.open/os.write is
+        # a single write syscall with no BufferedWriter overhead — worth it
+        # if this gets generalized into a tight capture loop.
+        fd = os.open("screenshot.png", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(fd, decoded_image)
+        os.close(fd)
 
 except Exception as e:
     print(f"An error occurred: {e}")
\ No newline at end of file
@@ -1,11 +1,51 @@
 import docker
+import os
 import time
-from docker.errors import NotFound
+import shlex
+import uuid
+from docker.errors import NotFound, ImageNotFound
+from docker.utils.socket import next_frame_header, read_exactly
 from typing import Optional, Dict, List, Union, Any
 import docker
 import time
 
+try:
+    # SIMD-accelerated base64 (SSSE3/AVX2/AVX-512, picked at runtime);
+    # falls back to the stdlib when the wheel is not installed.
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+
+def b64decode_untrusted(data):
+    """
+    Decode base64 that did not come from robotgo-cli. On the pybase64 path
+    validate=True rejects garbage in the same SIMD pass as the decode; the
+    stdlib fallback pays a separate translate-based scan. Trusted container
+    output can skip validation entirely (validate=False).
+    """
+    return _b64.b64decode(data, validate=True)
+
+
+# Validation sets hoisted out of the wrappers so the hot path does O(1)
+# membership tests instead of building a fresh list literal per call.
+_MOUSE_BUTTONS = frozenset({"left", "right", "middle", "wheelLeft", "wheelRight"})
+_SCROLL_DIRS = frozenset({"up", "down", "left", "right"})
+_TOGGLE_STATES = frozenset({"down", "up"})
+
+# Known base images and their derived tags with robotgo-cli baked in (see
+# Dockerfile.factorymanager). When the derived image is available locally,
+# it is used instead so cold starts skip the curl+chmod install entirely.
+_DERIVED_IMAGES = {
+    "lscr.io/linuxserver/chromium:latest": "factorymanager/chromium:latest",
+    "lscr.io/linuxserver/webtop:ubuntu-xfce": "factorymanager/webtop-ubuntu-xfce:latest",
+}
+
 class FactoryManager:
+    # Container ids already verified to have robotgo-cli, so repeated
+    # FactoryManager contexts in the same process skip the probe entirely.
+    _installed: set = set()
+
     def __init__(
         self,
         image: str,
@@ -40,20 +80,65 @@ class FactoryManager:
         self.devices = devices or []
         self.shm_size = shm_size
         self.restart_policy = restart_policy or {"Name": "unless-stopped"}
-        self.client = docker.from_env()
+        # One client with a single pooled keep-alive connection to the
+        # daemon; its low-level APIClient is kept on hand so the hot exec
+        # paths skip per-call session setup/teardown.
+        self.client = docker.DockerClient(
+            base_url=os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock"),
+            num_pools=1,
+            timeout=300
+        )
+        self.api = self.client.api
         self.container = None
 
+        derived = _DERIVED_IMAGES.get(image)
+        if derived:
+            try:
+                self.client.images.get(derived)
+                print(f"Using derived image '{derived}' with robotgo-cli baked in.")
+                self.image = derived
+            except ImageNotFound:
+                pass
+
+        # Persistent in-container shell used to run commands without paying
+        # the docker-exec setup cost (~150-500 ms) on every call.
+        self.shell_exec_id = None
+        self.shell_sock = None
+
         # Path to the robotgo-cli binary inside the container.
         self.robotgo_cli_path = "/usr/local/bin/robotgo-cli"
 
+        # Prebuilt command prefixes for the hottest commands, so each call
+        # only appends a short tail instead of rebuilding the full argument
+        # list. The mouse prefixes are pre-encoded shell lines: their tails
+        # are validated numbers/enum values that need no quoting, so the
+        # persistent shell gets a single bytes write with no argv marshalling.
+        self._mouse_move_line = f"{self.robotgo_cli_path} mouse move".encode('ascii')
+        self._mouse_click_line = f"{self.robotgo_cli_path} mouse click --button ".encode('ascii')
+        self._screen_capture_full = (self.robotgo_cli_path, "screen", "capture", "--full")
+
     def install_robotgo_cli_in_container(self):
         """
         Download and install the pre-built robotgo-cli binary inside the container.
+        The binary-exists probe goes over the persistent shell (one socket
+        write instead of a fresh docker exec) and the result is cached per
+        container id.
         """
-        check_cmd = f"ls {self.robotgo_cli_path}"
-        exec_result = self.container.exec_run(check_cmd)
-        if exec_result.exit_code == 0:
+        if self.container.id in FactoryManager._installed:
+            return
+
+        probe_cmd = f"test -x {self.robotgo_cli_path} && echo OK || echo MISSING"
+        result = None
+        if self.shell_sock is not None:
+            try:
+                result = self.__shell_line(probe_cmd, probe_cmd)
+            except OSError:
+                self.__close_shell()
+        if result is None:
+            result = self.container.exec_run(["/bin/sh", "-c", probe_cmd]).output.decode('utf-8').strip()
+        if result == "OK":
             print("robotgo-cli binary already exists inside the container. Skipping download.")
+            FactoryManager._installed.add(self.container.id)
             return
 
         release_url = "https://github.com/sampagon/robotgo-cli/releases/latest/download/robotgo-cli"
@@ -72,6 +157,7 @@ class FactoryManager:
             raise Exception(f"Failed to chmod robotgo-cli in container: {error_msg}")
 
         print("robotgo-cli installed inside the container.")
+        FactoryManager._installed.add(self.container.id)
 
     def start(self):
         """
@@ -102,15 +188,27 @@ class FactoryManager:
                 print(f"Container '{self.container_name}' started with ID: {self.container.id}")
                 print("Access webview at http://localhost:3000/vnc/index.html?autoconnect=1&rtrue=false&clipboard_up=true&clipboard_down=true&clipboard_seamless=true&show_control_bar=true&view_only=true")
 
-            self.container.reload()
-            if self.container.status != "running":
-                print(f"Container '{self.container_name}' is not running (status: {self.container.status}). Starting it...")
-                self.container.start()
-                time.sleep(2)
+            # containers.get/run already return fresh state — only hit the
+            # daemon again (reload) when that snapshot is not 'running'.
+            if self.container.attrs.get('State', {}).get('Status') != "running":
                 self.container.reload()
                 if self.container.status != "running":
-                    raise Exception(f"Container '{self.container_name}' failed to start (status: {self.container.status}).")
+                    print(f"Container '{self.container_name}' is not running (status: {self.container.status}). Starting it...")
+                    self.container.start()
+                    # Poll with exponential backoff instead of a flat 2 s
+                    # sleep — most containers flip to running within tens
+                    # of ms.
+                    for delay in (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0):
+                        self.container.reload()
+                        if self.container.status == "running":
+                            break
+                        time.sleep(delay)
+                    else:
+                        self.container.reload()
+                    if self.container.status != "running":
+                        raise Exception(f"Container '{self.container_name}' failed to start (status: {self.container.status}).")
 
+            self.__open_shell()
             self.install_robotgo_cli_in_container()
         except Exception as e:
             print(f"Error during startup: {e}")
@@ -121,6 +219,7 @@ class FactoryManager:
         """
         Stop the container.
         """
+        self.__close_shell()
         if self.container:
             try:
                 self.container.stop()
@@ -130,24 +229,198 @@ class FactoryManager:
         else:
             print("No container to stop.")
 
+    def __open_shell(self):
+        """
+        Start a persistent /bin/sh inside the container and keep its exec
+        socket open. Commands are streamed over this shell with framed
+        markers, cutting per-call overhead from hundreds of ms (a fresh
+        docker exec each time) to a few ms.
+        """
+        exec_id = self.api.exec_create(
+            self.container.id, ["/bin/sh"],
+            stdin=True, tty=False, stdout=True, stderr=True
+        )['Id']
+        self.shell_sock = self.api.exec_start(exec_id, socket=True)
+        self.shell_exec_id = exec_id
+
+    def __close_shell(self):
+        """
+        Close the persistent shell socket, if open.
+        """
+        if self.shell_sock:
+            try:
+                self.shell_sock.close()
+            except Exception:
+                pass
+        self.shell_sock = None
+        self.shell_exec_id = None
+
+    def __shell_command(self, cmd, want_output: bool = True) -> Optional[str]:
+        """
+        Run a command over the persistent shell. The command is framed with
+        unique begin/end markers so the response (and the exit code) can be
+        picked out of the shared stdout stream.
+
+        :raises OSError: If the shell socket is gone (caller falls back).
+        :raises Exception: If the command exits nonzero.
+        """
+        line = " ".join(shlex.quote(arg) for arg in cmd)
+        return self.__shell_line(line, " ".join(cmd), want_output)
+
+    def __shell_line(self, line: Union[str, bytes], display: str, want_output: bool = True) -> Optional[str]:
+        """
+        Run an already-built shell command line (str, or pre-encoded bytes
+        from a hot wrapper) over the persistent shell.
+
+        :raises OSError: If the shell socket is gone (caller falls back).
+        :raises Exception: If the command line exits nonzero.
+        """
+        marker = uuid.uuid4().hex
+        if isinstance(line, str):
+            line = line.encode('utf-8')
+        marker_b = marker.encode('ascii')
+        script = (b"printf '__BEG_" + marker_b + b"__\\n'; " + line +
+                  b"; printf '__END_" + marker_b + b"__:%d\\n' \"$?\"\n")
+        self.shell_sock._sock.sendall(script)
+        output, error_msg, exit_code = self.__read_shell_result(marker, want_output)
+        if exit_code != 0:
+            raise Exception(f"Command '{display}' failed with error: {error_msg or output}")
+        return output.strip() if want_output else None
+
+    def __read_shell_result(self, marker: str, want_output: bool = True):
+        """
+        Read frames off the shell socket until the end marker for this call
+        is seen, then split out stdout, stderr and the exit code. When
+        want_output is False, the (potentially large) stdout is only
+        decoded if the command failed and an error message is needed.
+        """
+        begin = f"__BEG_{marker}__\n".encode('utf-8')
+        end = f"__END_{marker}__:".encode('utf-8')
+        out = bytearray()
+        err = bytearray()
+        while True:
+            stream, length = next_frame_header(self.shell_sock)
+            if stream == -1:
+                raise OSError("Persistent shell closed unexpectedly.")
+            data = read_exactly(self.shell_sock, length)
+            if stream == 2:
+                err.extend(data)
+                continue
+            out.extend(data)
+            idx = out.find(end)
+            if idx != -1:
+                nl = out.find(b"\n", idx)
+                if nl != -1:
+                    break
+        exit_code = int(out[idx + len(end):nl])
+        if exit_code == 0 and not want_output:
+            return None, "", 0
+        start = out.find(begin) + len(begin)
+        stdout = bytes(out[start:idx]).decode('utf-8')
+        return stdout, bytes(err).decode('utf-8'), exit_code
+
+    def __exec_once(self, cmd, display: str, want_output: bool = True) -> Optional[str]:
+        """
+        One-shot docker exec used when the persistent shell is unavailable.
+        Streams demuxed output chunks into bytearrays rather than letting
+        the SDK buffer the whole (possibly multi-MB) payload into a single
+        bytes object — one less copy and ~2x lower peak memory.
+
+        :param cmd: Complete argument list to exec.
+        :param display: Human-readable command for error messages.
+        """
+        exec_id = self.api.exec_create(self.container.id, list(cmd))['Id']
+        stream = self.api.exec_start(exec_id, stream=True, demux=True)
+        out = bytearray()
+        err = bytearray()
+        for stdout, stderr in stream:
+            if stdout:
+                out.extend(stdout)
+            if stderr:
+                err.extend(stderr)
+        exit_code = self.api.exec_inspect(exec_id)['ExitCode']
+        if exit_code != 0:
+            error_msg = bytes(err or out).decode('utf-8')
+            raise Exception(f"Command '{display}' failed with error: {error_msg}")
+        return bytes(out).decode('utf-8').strip() if want_output else None
+
+    def __exec_raw(self, argv, want_output: bool = True) -> Optional[str]:
+        """
+        Execute a fully-assembled argv (cli path included) inside the
+        container, preferring the persistent shell and falling back to a
+        one-shot docker exec. Hot wrappers hand in a prebuilt tuple prefix
+        plus a short per-call tail, skipping any list rebuilding.
+
+        :param argv: Complete argument tuple/list starting with the cli path,
+                     or a pre-encoded bytes command line from a hot wrapper.
+        :param want_output: When False, skip decoding stdout and return None.
+        :return: Standard output as a string, or None if not wanted.
+        :raises Exception: If the command fails.
+        """
+        #print("Running command in container:", " ".join(argv))
+        if isinstance(argv, (bytes, bytearray)):
+            line = bytes(argv)
+            display = line.decode('ascii', 'replace')
+            if self.shell_sock is not None:
+                try:
+                    return self.__shell_line(line, display, want_output)
+                except OSError:
+                    self.__close_shell()
+            return self.__exec_once(["/bin/sh", "-c", display], display, want_output)
+        if self.shell_sock is not None:
+            try:
+                return self.__shell_command(argv, want_output)
+            except OSError:
+                # The shell died (e.g. container restart); drop to one-shot exec.
+                self.__close_shell()
+        return self.__exec_once(argv, " ".join(argv), want_output)
+
     def __command(self, command_args: List[str]) -> str:
         """
         Execute a robotgo-cli command inside the container.
-        
+
         :param command_args: List of command-line arguments.
         :return: Standard output as a string.
         :raises Exception: If the command fails.
         """
-        cmd = [self.robotgo_cli_path] + command_args
-        #print("Running command in container:", " ".join(cmd))
-        exec_result = self.container.exec_run(cmd)
-        if exec_result.exit_code != 0:
-            error_msg = exec_result.output.decode('utf-8')
-            raise Exception(f"Command '{' '.join(cmd)}' failed with error: {error_msg}")
-        return exec_result.output.decode('utf-8').strip()
+        return self.__exec_raw((self.robotgo_cli_path, *command_args))
+
+    def __command_void(self, command_args: List[str]) -> None:
+        """
+        Execute a robotgo-cli command whose output is discarded, skipping
+        the UTF-8 decode/validation of stdout on success.
+
+        :param command_args: List of command-line arguments.
+        :raises Exception: If the command fails.
+        """
+        self.__exec_raw((self.robotgo_cli_path, *command_args), want_output=False)
+
+    def _batch(self, commands: List[List[str]]) -> str:
+        """
+        Run several robotgo-cli invocations as a single in-container shell
+        command (cmd1 && cmd2 && ...). Action sequences whose output is
+        discarded (move-then-click, multi-key taps) pay one round-trip
+        instead of one per command.
+
+        :param commands: List of robotgo-cli argument lists.
+        :return: Combined standard output as a string.
+        :raises Exception: If any command in the sequence fails.
+        """
+        if not commands or not all(isinstance(args, list) and args for args in commands):
+            raise ValueError("commands must be a non-empty list of non-empty argument lists")
+        line = " && ".join(
+            " ".join(shlex.quote(a) for a in [self.robotgo_cli_path] + args)
+            for args in commands
+        )
+        if self.shell_sock is not None:
+            try:
+                return self.__shell_line(line, line)
+            except OSError:
+                self.__close_shell()
+        return self.__exec_once(["/bin/sh", "-c", line], line)
 
     # --- Mouse Commands ---
-    def mouse_move(self, coordinate: List[Union[int, float]]) -> str:
+    def mouse_move(self, coordinate: List[Union[int, float]]) -> None:
         """
         Move the mouse to the given coordinate [x, y].
         
@@ -157,48 +430,48 @@ class FactoryManager:
         if not (isinstance(coordinate, list) and len(coordinate) == 2 and all(isinstance(n, (int, float)) for n in coordinate)):
             raise ValueError("coordinate must be a list of two numbers")
         x, y = coordinate
-        return self.__command(["mouse", "move", "--x", str(x), "--y", str(y)])
+        self.__exec_raw(self._mouse_move_line + f" --x={x} --y={y}".encode('ascii'), want_output=False)
 
-    def mouse_click(self, button: str = "left", double: bool = False) -> str:
+    def mouse_click(self, button: str = "left", double: bool = False) -> None:
         """
         Click a mouse button.
         
         :param button: Button name (e.g., left, right, middle, wheelLeft, wheelRight).
         :param double: True for a double click.
         """
-        if button not in ["left", "right", "middle", "wheelLeft", "wheelRight"]:
+        if button not in _MOUSE_BUTTONS:
             raise ValueError("Invalid mouse button. Choose from left, right, middle, wheelLeft, wheelRight.")
-        args = ["mouse", "click", "--button", button]
+        line = self._mouse_click_line + button.encode('ascii')
         if double:
-            args += ["--double", "true"]
-        return self.__command(args)
+            line += b" --double true"
+        self.__exec_raw(line, want_output=False)
 
-    def mouse_scroll(self, direction: str = "up", steps: int = 10) -> str:
+    def mouse_scroll(self, direction: str = "up", steps: int = 10) -> None:
         """
         Scroll the mouse in a given direction.
         
         :param direction: One of "up", "down", "left", "right".
         :param steps: Number of scroll steps.
         """
-        if direction not in ["up", "down", "left", "right"]:
+        if direction not in _SCROLL_DIRS:
             raise ValueError("direction must be one of up, down, left, right")
         if not isinstance(steps, int) or steps < 1:
             raise ValueError("steps must be a positive integer")
-        return self.__command(["mouse", "scroll", "--direction", direction, "--steps", str(steps)])
+        self.__command_void(["mouse", "scroll", "--direction", direction, "--steps", str(steps)])
 
-    def mouse_toggle(self, button: str = "left", state: str = "down") -> str:
+    def mouse_toggle(self, button: str = "left", state: str = "down") -> None:
         """
         Toggle the state of a mouse button.
         
         :param button: The mouse button (e.g., left).
         :param state: "down" or "up".
         """
-        if state not in ["down", "up"]:
+        if state not in _TOGGLE_STATES:
             raise ValueError("state must be either 'down' or 'up'")
-        return self.__command(["mouse", "toggle", "--button", button, "--state", state])
+        self.__command_void(["mouse", "toggle", "--button", button, "--state", state])
 
     # --- Keyboard Commands ---
-    def keyboard_type(self, text: str) -> str:
+    def keyboard_type(self, text: str) -> None:
         """
         Type a string using the keyboard.
         
@@ -207,9 +480,9 @@ class FactoryManager:
         """
         if not isinstance(text, str) or not text.strip():
             raise ValueError("text must be a non-empty string")
-        return self.__command(["keyboard", "type", "--text", text])
+        self.__command_void(["keyboard", "type", "--text", text])
 
-    def keyboard_tap(self, key: str, mods: Optional[List[str]] = None) -> str:
+    def keyboard_tap(self, key: str, mods: Optional[List[str]] = None) -> None:
         """
         Tap a key with optional modifiers.
         
@@ -224,20 +497,20 @@ class FactoryManager:
             if not all(isinstance(mod, str) and mod.strip() for mod in mods):
                 raise ValueError("mods must be a list of non-empty strings")
             args += ["--mods", ",".join(mods)]
-        return self.__command(args)
+        self.__command_void(args)
 
-    def keyboard_toggle(self, key: str, state: str = "down") -> str:
+    def keyboard_toggle(self, key: str, state: str = "down") -> None:
         """
         Toggle a key state (down/up).
         
         :param key: The key to toggle.
         :param state: "down" or "up".
         """
-        if state not in ["down", "up"]:
+        if state not in _TOGGLE_STATES:
             raise ValueError("state must be either 'down' or 'up'")
         if not isinstance(key, str) or not key.strip():
             raise ValueError("key must be a non-empty string")
-        return self.__command(["keyboard", "toggle", "--key", key, "--state", state])
+        self.__command_void(["keyboard", "toggle", "--key", key, "--state", state])
 
     # --- Screen Commands ---
     def screen_capture(self,
@@ -254,11 +527,34 @@ class FactoryManager:
             if not isinstance(val, int) or val < 0:
                 raise ValueError(f"{name} must be a non-negative integer")
         if full:
-            return self.__command(["screen", "capture", "--full"])
+            return self.__exec_raw(self._screen_capture_full)
         else:
             return self.__command(["screen", "capture", "--x", str(x), "--y", str(y),
                                     "--width", str(width), "--height", str(height)])
 
+    def screen_capture_raw(self) -> bytes:
+        """
+        Capture the full screen and return the raw PNG bytes, streamed
+        directly over the exec socket. Skips the base64 encode in the
+        container and the decode on the host — ~33% less bytes moved and
+        zero decode cost compared to screen_capture(full=True).
+        """
+        cmd = [self.robotgo_cli_path, "screen", "capture", "--full", "--stdout-binary"]
+        exec_id = self.api.exec_create(self.container.id, cmd)['Id']
+        stream = self.api.exec_start(exec_id, stream=True, demux=True)
+        buf = bytearray()
+        err = bytearray()
+        for out, e in stream:
+            if out:
+                buf.extend(out)
+            if e:
+                err.extend(e)
+        exit_code = self.api.exec_inspect(exec_id)['ExitCode']
+        if exit_code != 0:
+            error_msg = bytes(err or buf).decode('utf-8')
+            raise Exception(f"Command '{' '.join(cmd)}' failed with error: {error_msg}")
+        return bytes(buf)
+
     def screen_getpixel(self, x: int, y: int) -> str:
         """
         Get the color of the pixel at the specified coordinates.
@@ -274,25 +570,25 @@ class FactoryManager:
         return self.__command(["screen", "size"])
 
     # --- Window Commands ---
-    def window_activate(self, name: Optional[str] = None, pid: Optional[int] = None) -> str:
+    def window_activate(self, name: Optional[str] = None, pid: Optional[int] = None) -> None:
         """
         Activate a window by name or process ID.
         At least one of name or pid must be provided.
         """
         if name:
-            return self.__command(["window", "activate", "--name", name])
+            self.__command_void(["window", "activate", "--name", name])
         elif pid and isinstance(pid, int):
-            return self.__command(["window", "activate", "--pid", str(pid)])
+            self.__command_void(["window", "activate", "--pid", str(pid)])
         else:
             raise ValueError("Please provide either a window name or a valid pid.")
 
-    def window_kill(self, pid: int) -> str:
+    def window_kill(self, pid: int) -> None:
         """
         Kill a process by PID.
         """
         if not isinstance(pid, int) or pid <= 0:
             raise ValueError("pid must be a positive integer")
-        return self.__command(["window", "kill", "--pid", str(pid)])
+        self.__command_void(["window", "kill", "--pid", str(pid)])
 
     def window_title(self) -> str:
         """
@@ -307,13 +603,13 @@ class FactoryManager:
         """
         return self.__command(["clipboard", "read"])
 
-    def clipboard_write(self, text: str) -> str:
+    def clipboard_write(self, text: str) -> None:
         """
         Write text to the clipboard.
         """
         if not isinstance(text, str) or not text.strip():
             raise ValueError("text must be a non-empty string")
-        return self.__command(["clipboard", "write", "--text", text])
+        self.__command_void(["clipboard", "write", "--text", text])
 
     # --- Process Commands ---
     def process_list(self) -> str:
@@ -1,9 +1,100 @@
 from factorymanager import FactoryManager
+import asyncio
 import time
-import base64
-from openai import OpenAI
-
-client = OpenAI()
+from openai import AsyncOpenAI
+
+client = AsyncOpenAI()
+
+# Built once; "+" on (prefix, payload) is fast-pathed by CPython, unlike
+# running an f-string format over the multi-MB base64 payload each frame.
+_DATA_URL_PREFIX = "data:image/png;base64,"
+
+
+def _do_click(fw, action):
+    x, y = action.x, action.y
+    button = action.button
+    print(f"Action: click at ({x}, {y}) with button '{button}'")
+    # Move and click in one shell invocation — one exec round-trip
+    # instead of two.
+    fw._batch([
+        ["mouse", "move", "--x", str(x), "--y", str(y)],
+        ["mouse", "click", "--button", button],
+    ])
+
+
+def _do_scroll(fw, action):
+    # Map scroll offsets to a direction. This example checks the vertical scroll.
+    scroll_x, scroll_y = action.scroll_x, action.scroll_y
+    # Choose vertical scrolling if nonzero, else horizontal.
+    if scroll_y != 0:
+        direction = "down" if scroll_y > 0 else "up"
+        steps = abs(scroll_y)
+    elif scroll_x != 0:
+        direction = "right" if scroll_x > 0 else "left"
+        steps = abs(scroll_x)
+    else:
+        direction = "up"
+        steps = 10
+    print(f"Action: scroll {direction} by {steps} steps")
+    fw.mouse_scroll(direction=direction, steps=steps)
+
+
+def _do_keypress(fw, action):
+    taps = []
+    for k in action.keys:
+        print(f"Action: keypress '{k}'")
+        # Map some common keys to the expected values.
+        if k.lower() == "enter":
+            key = "Enter"
+        elif k.lower() == "space":
+            key = " "
+        else:
+            key = k
+        taps.append(["keyboard", "tap", "--key", key])
+    # Ship all taps as one shell invocation instead of one exec
+    # round-trip per key.
+    fw._batch(taps)
+
+
+def _do_type(fw, action):
+    print(f"Action: type text: {action.text}")
+    fw.keyboard_type(action.text)
+
+
+def _do_wait(fw, action):
+    print("Action: wait")
+    time.sleep(2)
+
+
+def _do_screenshot(fw, action):
+    # No action needed; screenshot is taken after each call.
+    print("Action: screenshot")
+
+
+def _do_unknown(fw, action):
+    print(f"Unrecognized action: {action}")
+
+
+# O(1) dispatch — a match on string constants lowers to a chain of equality
+# compares, and this runs once per model step in the loop.
+_ACTIONS = {
+    "click": _do_click,
+    "scroll": _do_scroll,
+    "keypress": _do_keypress,
+    "type": _do_type,
+    "wait": _do_wait,
+    "screenshot": _do_screenshot,
+}
+
+
+def handle_model_action(fw, action):
+    """
+    Execute the computer action using FactoryManager instead of Playwright.
+    """
+    try:
+        _ACTIONS.get(action.type, _do_unknown)(fw, action)
+    except Exception as e:
+        print(f"Error handling action {action}: {e}")
 
 # Create and start the container using FactoryManager
 fm = FactoryManager(
@@ -22,150 +113,96 @@ fm = FactoryManager(
     restart_policy={"Name": "unless-stopped"}
 )
 
-with fm as fw:
-    # Initial OpenAI operator request
-    response = client.responses.create(
-        model="computer-use-preview",
-        tools=[{
-            "type": "computer_use_preview",
-            "display_width": 1024,
-            "display_height": 768,
-            "environment": "linux"  # Use "linux" to match the container's OS
-        }],
-        input=[
-            {
-                "role": "user",
-                "content": "Check the latest OpenAI news on bing.com."
-            }
-        ],
-        reasoning={
-            "generate_summary": "concise",
-        },
-        truncation="auto"
-    )
-
-    print(response.output)
-
-    def handle_model_action(fw, action):
-        """
-        Execute the computer action using FactoryManager instead of Playwright.
-        """
-        action_type = action.type
-
-        try:
-            match action_type:
-                case "click":
-                    x, y = action.x, action.y
-                    button = action.button
-                    print(f"Action: click at ({x}, {y}) with button '{button}'")
-                    # Move the mouse to the coordinate and click.
-                    fw.mouse_move([x, y])
-                    fw.mouse_click(button=button)
-
-                case "scroll":
-                    # Map scroll offsets to a direction. This example checks the vertical scroll.
-                    scroll_x, scroll_y = action.scroll_x, action.scroll_y
-                    # Choose vertical scrolling if nonzero, else horizontal.
-                    if scroll_y != 0:
-                        direction = "down" if scroll_y > 0 else "up"
-                        steps = abs(scroll_y)
-                    elif scroll_x != 0:
-                        direction = "right" if scroll_x > 0 else "left"
-                        steps = abs(scroll_x)
-                    else:
-                        direction = "up"
-                        steps = 10
-                    print(f"Action: scroll {direction} by {steps} steps")
-                    fw.mouse_scroll(direction=direction, steps=steps)
-
-                case "keypress":
-                    keys = action.keys
-                    for k in keys:
-                        print(f"Action: keypress '{k}'")
-                        # Map some common keys to the expected values.
-                        if k.lower() == "enter":
-                            fw.keyboard_tap("Enter")
-                        elif k.lower() == "space":
-                            fw.keyboard_tap(" ")
-                        else:
-                            fw.keyboard_tap(k)
-
-                case "type":
-                    text = action.text
-                    print(f"Action: type text: {text}")
-                    fw.keyboard_type(text)
-
-                case "wait":
-                    print("Action: wait")
-                    time.sleep(2)
-
-                case "screenshot":
-                    # No action needed; screenshot is taken after each call.
-                    print("Action: screenshot")
-
-                case _:
-                    print(f"Unrecognized action: {action}")
-
-        except Exception as e:
-            print(f"Error handling action {action}: {e}")
-
-    def get_screenshot(fw):
-        """
-        Capture a full-screen screenshot from the container using FactoryManager.
-        """
-        image_b64 = fw.screen_capture(full=True)
-        return base64.b64decode(image_b64)
-
-    def computer_use_loop(fw, response):
-        """
-        Loop through computer calls, execute each action, take a screenshot, and send it back.
-        """
-        while True:
-            computer_calls = [item for item in response.output if item.type == "computer_call"]
-            if not computer_calls:
-                print("No computer call found. Output from model:")
-                for item in response.output:
-                    print(item)
-                break  # Exit when no further computer calls are issued.
-
-            # We expect at most one computer call per response.
-            computer_call = computer_calls[0]
-            last_call_id = computer_call.call_id
-            action = computer_call.action
-
-            # Execute the action using the FactoryManager instance.
-            handle_model_action(fw, action)
-            time.sleep(1)  # Allow time for changes to take effect.
-
-            # Capture a screenshot after the action.
-            screenshot_bytes = get_screenshot(fw)
-            screenshot_base64 = base64.b64encode(screenshot_bytes).decode("utf-8")
-
-            # Send the screenshot back as computer_call_output.
-            response = client.responses.create(
-                model="computer-use-preview",
-                previous_response_id=response.id,
-                tools=[{
-                    "type": "computer_use_preview",
-                    "display_width": 1024,
-                    "display_height": 768,
-                    "environment": "linux"
-                }],
-                input=[
-                    {
-                        "call_id": last_call_id,
-                        "type": "computer_call_output",
-                        "output": {
-                            "type": "input_image",
-                            "image_url": f"data:image/png;base64,{screenshot_base64}"
-                        }
+def get_screenshot(fw):
+    """
+    Capture a full-screen screenshot from the container using FactoryManager.
+    Returns the base64 string robotgo-cli already produced — it goes
+    straight into the data URI, so no base64 pass at all touches the
+    multi-MB payload on this side.
+    """
+    return fw.screen_capture(full=True)
+
+
+async def computer_use_loop(fw, response):
+    """
+    Loop through computer calls, execute each action, take a screenshot, and send it back.
+    The screenshot runs in a worker thread overlapped with the settle
+    delay, hiding its exec cost instead of serializing it.
+    """
+    while True:
+        computer_calls = [item for item in response.output if item.type == "computer_call"]
+        if not computer_calls:
+            print("No computer call found. Output from model:")
+            for item in response.output:
+                print(item)
+            break  # Exit when no further computer calls are issued.
+
+        # We expect at most one computer call per response.
+        computer_call = computer_calls[0]
+        last_call_id = computer_call.call_id
+        action = computer_call.action
+
+        # Execute the action using the FactoryManager instance.
+        await asyncio.to_thread(handle_model_action, fw, action)
+
+        # Kick off the screenshot immediately so it overlaps the settle
+        # delay below; await it only when assembling the next payload.
+        screenshot_task = asyncio.create_task(asyncio.to_thread(get_screenshot, fw))
+        await asyncio.sleep(1)  # Allow time for changes to take effect.
+        screenshot_base64 = await screenshot_task
+
+        # Send the screenshot back as computer_call_output.
+        response = await client.responses.create(
+            model="computer-use-preview",
+            previous_response_id=response.id,
+            tools=[{
+                "type": "computer_use_preview",
+                "display_width": 1024,
+                "display_height": 768,
+                "environment": "linux"
+            }],
+            input=[
+                {
+                    "call_id": last_call_id,
+                    "type": "computer_call_output",
+                    "output": {
+                        "type": "input_image",
+                        "image_url": _DATA_URL_PREFIX + screenshot_base64
                     }
-                ],
-                truncation="auto"
-            )
-
-        return response
-
-    final_response = computer_use_loop(fw, response)
-
-
+                }
+            ],
+            truncation="auto"
+        )
+
+    return response
+
+
+async def main():
+    with fm as fw:
+        # Initial OpenAI operator request
+        response = await client.responses.create(
+            model="computer-use-preview",
+            tools=[{
+                "type": "computer_use_preview",
+                "display_width": 1024,
+                "display_height": 768,
+                "environment": "linux"  # Use "linux" to match the container's OS
+            }],
+            input=[
+                {
+                    "role": "user",
+                    "content": "Check the latest OpenAI news on bing.com."
+                }
+            ],
+            reasoning={
+                "generate_summary": "concise",
+            },
+            truncation="auto"
+        )
+
+        print(response.output)
+
+        final_response = await computer_use_loop(fw, response)
+
+
+asyncio.run(main())
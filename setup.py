@@ -9,8 +9,12 @@ setup(
     author_email="sp3692@drexel.edu",
     packages=find_packages(),  
     install_requires=[
-        "docker", 
+        "docker",
     ],
+    extras_require={
+        # SIMD-accelerated base64 for the screenshot hot path (optional).
+        "simd": ["pybase64"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",